@@ -3,6 +3,8 @@
 from flask import Flask, render_template, request, redirect, url_for, session, abort, send_file
 import os
 import csv
+import gc
+import time
 from datetime import datetime
 import random
 
@@ -72,6 +74,51 @@ RESULTS_FILE = os.path.join('results', 'study_results.csv')
 # Ensure the results directory exists
 os.makedirs('results', exist_ok=True)
 
+# Set LMAIK_PRELOAD_MOTIONS=1 to parse every BVH file and compute its joint
+# positions at import time. Under gunicorn with preload_app this happens once in
+# the master process, so forked workers share the data instead of each parsing
+# it on their first analysis request.
+PRELOAD_MOTIONS = os.environ.get('LMAIK_PRELOAD_MOTIONS') == '1'
+
+MOTION_STATUS = {
+    'preload': PRELOAD_MOTIONS,
+    'ready': not PRELOAD_MOTIONS,
+    'loaded': 0,
+    'expected': 0,
+    'seconds': None,
+    'errors': {},
+}
+
+
+def preload_motion_data():
+    """Load all motions referenced by TRIAL_CATEGORIES into the shared cache"""
+    from bvh_parser import preload_motions
+
+    filenames = sorted({filename for pair in ALL_PAIRS for filename in pair})
+    filepaths = [os.path.join('static', 'bvh', filename) for filename in filenames]
+
+    start_time = time.perf_counter()
+    errors = preload_motions(filepaths)
+
+    MOTION_STATUS['expected'] = len(filepaths)
+    MOTION_STATUS['loaded'] = len(filepaths) - len(errors)
+    MOTION_STATUS['seconds'] = round(time.perf_counter() - start_time, 2)
+    MOTION_STATUS['errors'] = errors
+    MOTION_STATUS['ready'] = not errors
+
+    # Move everything allocated so far out of the garbage collector's reach so
+    # collections in the workers don't write to (and un-share) these pages
+    gc.freeze()
+
+    if errors:
+        app.logger.error("Failed to preload motions: %s", errors)
+    else:
+        app.logger.info("Preloaded %d motions in %ss", MOTION_STATUS['loaded'], MOTION_STATUS['seconds'])
+
+
+if PRELOAD_MOTIONS:
+    preload_motion_data()
+
 # --- Routes ---
 
 # <-- CHANGED: The root route '/' now handles both GET and POST requests.
@@ -417,6 +464,15 @@ def test_all_pairs_python():
     return jsonify(results)
 
 
+@app.route('/health')
+def health():
+    """Readiness check used by the deployment scripts"""
+    from flask import jsonify
+
+    status_code = 200 if MOTION_STATUS['ready'] else 503
+    return jsonify({'status': 'ok' if MOTION_STATUS['ready'] else 'unavailable', **MOTION_STATUS}), status_code
+
+
 @app.route('/mpjpe_test')
 def mpjpe_test():
     """Test page to compare Python vs JavaScript MPJPE calculations"""
@@ -1,9 +1,15 @@
 """
 Simple BVH parser for calculating MPJPE
 """
+import os
 import numpy as np
 import re
 
+# Parsed motions and their joint positions, keyed by absolute file path.
+# Filled by preload_motions() before the server forks so that all workers
+# share a single read-only copy of the data.
+_MOTION_CACHE = {}
+
 
 class BVHJoint:
     def __init__(self, name, parent=None):
@@ -182,36 +188,66 @@ def parse_bvh(filepath):
     return motion
 
 
+def compute_positions(motion):
+    """Compute world positions of all joints for every frame, shape (frames, joints, 3)"""
+    positions = [motion.get_joint_positions(frame) for frame in range(motion.frames)]
+    return np.array(positions).reshape(motion.frames, len(motion.joints), 3)
+
+
+def load_motion(filepath):
+    """Return (motion, positions) for a BVH file, using the preloaded copy if available"""
+    cached = _MOTION_CACHE.get(os.path.abspath(filepath))
+    if cached is not None:
+        return cached
+
+    motion = parse_bvh(filepath)
+    return motion, compute_positions(motion)
+
+
+def preload_motions(filepaths):
+    """Parse BVH files and compute their joint positions once, caching them read-only.
+
+    The arrays are never written after this point, so when called before the
+    server forks the memory pages stay shared copy-on-write between workers.
+    Returns a dict mapping each file that failed to load to its error message.
+    """
+    errors = {}
+
+    for filepath in filepaths:
+        try:
+            motion = parse_bvh(filepath)
+            positions = compute_positions(motion)
+        except Exception as e:
+            errors[filepath] = str(e)
+            continue
+
+        motion.motion_data.setflags(write=False)
+        positions.setflags(write=False)
+        _MOTION_CACHE[os.path.abspath(filepath)] = (motion, positions)
+
+    return errors
+
+
 def calculate_mpjpe(bvh1_path, bvh2_path):
     """Calculate MPJPE between two BVH files"""
-    motion1 = parse_bvh(bvh1_path)
-    motion2 = parse_bvh(bvh2_path)
+    motion1, positions1 = load_motion(bvh1_path)
+    motion2, positions2 = load_motion(bvh2_path)
 
     # Use the shorter sequence
     num_frames = min(motion1.frames, motion2.frames)
     num_joints = min(len(motion1.joints), len(motion2.joints))
 
-    total_error = 0.0
     frame_errors = []
 
-    for frame in range(num_frames):
-        positions1 = motion1.get_joint_positions(frame)
-        positions2 = motion2.get_joint_positions(frame)
-
-        if positions1 is None or positions2 is None:
-            continue
-
-        # Calculate mean error for this frame
-        frame_error = 0.0
-        for j in range(num_joints):
-            distance = np.linalg.norm(positions1[j] - positions2[j])
-            frame_error += distance
-
-        frame_mean_error = frame_error / num_joints
-        frame_errors.append(frame_mean_error)
-        total_error += frame_mean_error
+    if num_frames and num_joints:
+        # Mean joint distance for each frame
+        distances = np.linalg.norm(
+            positions1[:num_frames, :num_joints] - positions2[:num_frames, :num_joints],
+            axis=2
+        )
+        frame_errors = distances.mean(axis=1).tolist()
 
-    mpjpe = total_error / len(frame_errors) if frame_errors else 0.0
+    mpjpe = sum(frame_errors) / len(frame_errors) if frame_errors else 0.0
 
     return {
         'mpjpe': mpjpe,
@@ -115,33 +115,6 @@ log "Creating log directory..."
 sudo mkdir -p /var/log/$APP_NAME
 sudo chown $APP_USER:$APP_USER /var/log/$APP_NAME
 
-# Create Flask startup script
-log "Creating Flask startup script..."
-sudo tee $APP_DIR/start_flask.py > /dev/null <<EOF
-#!/usr/bin/env python3
-"""
-Flask startup script for production
-"""
-import os
-import sys
-
-# Add the application directory to Python path
-sys.path.insert(0, '/opt/lmaik-userstudy')
-
-# Set environment variables
-os.environ['FLASK_ENV'] = 'production'
-os.environ['FLASK_DEBUG'] = '0'
-
-# Import and run the Flask app
-from app import app
-
-if __name__ == '__main__':
-    app.run(host='127.0.0.1', port=8000, debug=False, threaded=True)
-EOF
-
-# Make the startup script executable
-sudo chmod +x $APP_DIR/start_flask.py
-
 # Create systemd service file
 log "Creating systemd service..."
 sudo tee /etc/systemd/system/$SERVICE_NAME.service > /dev/null <<EOF
@@ -157,7 +130,7 @@ WorkingDirectory=/opt/lmaik-userstudy
 Environment=PATH=/opt/lmaik-userstudy/venv/bin
 Environment=FLASK_ENV=production
 Environment=FLASK_DEBUG=0
-ExecStart=/opt/lmaik-userstudy/venv/bin/python start_flask.py
+ExecStart=/opt/lmaik-userstudy/venv/bin/gunicorn -c gunicorn.conf.py app:app
 ExecReload=/bin/kill -s HUP \$MAINPID
 Restart=always
 RestartSec=3
@@ -238,7 +211,7 @@ sudo chown lmaik:lmaik $APP_DIR/*.sh
 # Test the application
 log "Testing application..."
 sleep 5
-if curl -f -s http://localhost > /dev/null; then
+if curl -f -s http://localhost/health > /dev/null; then
     log "Application is running successfully!"
 else
     warn "Application might not be fully started yet. Please check logs:"
@@ -75,7 +75,7 @@ wait_for_ready() {
     local attempt=1
     
     while [ $attempt -le $max_attempts ]; do
-        if curl -f -s http://localhost > /dev/null; then
+        if curl -f -s http://localhost/health > /dev/null; then
             log "Application is ready!"
             return 0
         else
@@ -6,6 +6,7 @@
 APP_NAME="lmaik-userstudy"
 SERVICE_NAME="lmaik-userstudy"
 APP_URL="http://localhost"
+HEALTH_URL="$APP_URL/health"
 
 # Colors for output
 RED='\033[0;31m'
@@ -62,6 +63,21 @@ check_application_response() {
     echo ""
 }
 
+# Check application readiness (motion data preloaded)
+check_application_health() {
+    echo -e "${BLUE}=== Application Health ===${NC}"
+    local health=$(curl -s $HEALTH_URL)
+    if curl -f -s $HEALTH_URL > /dev/null; then
+        echo -e "${GREEN}✓ Application is ready${NC}"
+    else
+        echo -e "${RED}✗ Application is not ready${NC}"
+    fi
+    if [ -n "$health" ]; then
+        echo -e "Health: $health"
+    fi
+    echo ""
+}
+
 # Check system resources
 check_system_resources() {
     echo -e "${BLUE}=== System Resources ===${NC}"
@@ -160,6 +176,9 @@ main() {
     
     # Check application response
     check_application_response
+
+    # Check application readiness
+    check_application_health
     
     # Check system resources
     check_system_resources
@@ -181,7 +200,7 @@ main() {
     echo ""
     
     # Overall status
-    if systemctl is-active --quiet $SERVICE_NAME && systemctl is-active --quiet nginx && curl -f -s $APP_URL > /dev/null; then
+    if systemctl is-active --quiet $SERVICE_NAME && systemctl is-active --quiet nginx && curl -f -s $HEALTH_URL > /dev/null; then
         echo -e "${GREEN}✓ All systems operational${NC}"
         exit 0
     else
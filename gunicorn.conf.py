@@ -0,0 +1,16 @@
+# gunicorn.conf.py
+
+import os
+
+bind = '127.0.0.1:8000'
+workers = int(os.environ.get('GUNICORN_WORKERS', '4'))
+# Match the Nginx proxy timeouts
+timeout = 300
+
+# Import the app (and preload all motion data) once in the master process,
+# then fork the workers so they share that memory copy-on-write.
+preload_app = True
+os.environ.setdefault('LMAIK_PRELOAD_MOTIONS', '1')
+
+accesslog = '-'
+errorlog = '-'